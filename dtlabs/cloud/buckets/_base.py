@@ -5,7 +5,69 @@ It provides an abstract interface that specific providers (AWS, OCI, etc.) will
 
 from abc import ABC, abstractmethod
 import io
-from typing import Union
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from ._url_cache import URLCache
+
+# Default part size used by upload_stream.
+STREAM_PART_SIZE = 16 * 1024 * 1024
+
+# upload_item sends items up to this size as a single PutObject; larger items,
+# and streams whose size is unknown, are uploaded as concurrent multipart chunks.
+SINGLE_PUT_LIMIT = 16 * 1024 * 1024
+
+# Smallest part size S3 accepts for every part but the last.
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+def _item_size(item: Union[bytes, bytearray, io.IOBase]) -> Optional[int]:
+    """
+    Returns the number of bytes upload_item would send for item.
+
+    Streams are measured from their current position with seek/tell and left
+    where they were. None is returned for streams that can't seek.
+
+    :param item: The content, as bytes, bytearray or a binary stream.
+    :return: The size in bytes, or None when it is unknown.
+    """
+    if isinstance(item, (bytes, bytearray)):
+        return len(item)
+    if not (hasattr(item, "seekable") and item.seekable()):
+        return None
+    position = item.tell()
+    end = item.seek(0, io.SEEK_END)
+    item.seek(position)
+    return end - position
+
+
+def _check_part_size(part_size: int):
+    """
+    Rejects upload_stream part sizes below MIN_PART_SIZE before anything is
+    uploaded, instead of letting the final commit fail.
+    """
+    if part_size < MIN_PART_SIZE:
+        raise ValueError(
+            f"part_size must be at least {MIN_PART_SIZE} bytes, got {part_size}.")
+
+
+def _iter_parts(chunks: Iterable[bytes], part_size: int) -> Iterator[Tuple[bytes, bool]]:
+    """
+    Regroups a stream of chunks into parts of exactly part_size bytes.
+
+    A full part is only emitted once more data follows it, so a stream that
+    fits in a single part yields exactly one item flagged as the last.
+
+    :param chunks: An iterable of byte chunks of any size.
+    :param part_size: The size of every part except the last.
+    :return: An iterator of (part, is_last) tuples.
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) > part_size:
+            yield bytes(buffer[:part_size]), False
+            del buffer[:part_size]
+    yield bytes(buffer), True
 
 
 class BucketService(ABC):
@@ -15,14 +77,19 @@ class BucketService(ABC):
     Abstract methods:
         - upload_item: Uploads an item (bytes or stream) to the bucket.
         - upload_file: Uploads a local file to the bucket.
+        - upload_stream: Uploads data from an iterator of chunks without buffering it all.
         - delete_file: Deletes a file from the bucket.
         - read_file: Reads the content of a file from the bucket.
         - list_folder: Lists files within a specific folder in the bucket.
         - generate_url: Generates a signed URL to access a file in the bucket.
         - download_file: Downloads a file from the bucket to the local system.
         - delete_folder: Deletes a folder and all its contents from the bucket.
+        - _put_single, _create_multipart, _upload_part, _commit_multipart and
+          _abort_multipart: Multipart hooks used by _upload_parts.
     """
 
+    __slots__ = ("bucket", "_url_cache")
+
     def __init__(self, bucket: str):
         """
         Initializes the storage service with the specified bucket name.
@@ -30,6 +97,7 @@ class BucketService(ABC):
         :param bucket: The name of the bucket.
         """
         self.bucket = bucket
+        self._url_cache = URLCache()
 
     @abstractmethod
     def upload_item(self, target_path: str, item: Union[bytes, io.BytesIO]):
@@ -49,6 +117,20 @@ class BucketService(ABC):
         :param target_path: The target path in the bucket.
         """
 
+    @abstractmethod
+    def upload_stream(self, target_path: str, chunk_iter: Iterable[bytes],
+                      part_size: int = STREAM_PART_SIZE):
+        """
+        Uploads data produced by an iterator of byte chunks to the specified path in the bucket.
+        Data is sent in parts as it arrives; a stream that fits in one part is sent
+        with a single request.
+
+        :param target_path: The target path in the bucket.
+        :param chunk_iter: An iterable yielding the content as byte chunks.
+        :param part_size: Size of each uploaded part in bytes (default: 16MB, minimum: 5MB).
+        :raises ValueError: If part_size is below the minimum.
+        """
+
     @abstractmethod
     def delete_file(self, target_path: str):
         """
@@ -79,6 +161,7 @@ class BucketService(ABC):
     def generate_url(self, target: str, expiration=3600):
         """
         Generates a signed URL for accessing a file in the bucket.
+        Implementations reuse a cached URL while at least half of its lifetime remains.
 
         :param target: The file path in the bucket.
         :param expiration: URL expiration time in seconds (default: 3600).
@@ -101,3 +184,51 @@ class BucketService(ABC):
 
         :param folder_path: The folder path to delete.
         """
+
+    def _upload_parts(self, target_path: str, chunk_iter: Iterable[bytes], part_size: int):
+        """
+        Runs upload_stream on top of the multipart hooks below.
+
+        The first full part starts a multipart upload; a stream that fits in one
+        part is sent with _put_single instead. A started upload is aborted if
+        anything fails.
+
+        :param target_path: The target path in the bucket.
+        :param chunk_iter: An iterable yielding the content as byte chunks.
+        :param part_size: Size of each uploaded part in bytes.
+        :return: The result of _put_single or _commit_multipart.
+        """
+        upload_id = None
+        parts = []
+        try:
+            for part_number, (part, last) in enumerate(_iter_parts(chunk_iter, part_size), 1):
+                if upload_id is None:
+                    if last:
+                        return self._put_single(target_path, part)
+                    upload_id = self._create_multipart(target_path)
+                parts.append(self._upload_part(target_path, upload_id, part_number, part))
+            return self._commit_multipart(target_path, upload_id, parts)
+        except Exception:
+            if upload_id is not None:
+                self._abort_multipart(target_path, upload_id)
+            raise
+
+    @abstractmethod
+    def _put_single(self, target_path: str, data: bytes):
+        """Uploads data as a single object."""
+
+    @abstractmethod
+    def _create_multipart(self, target_path: str):
+        """Starts a multipart upload and returns its upload id."""
+
+    @abstractmethod
+    def _upload_part(self, target_path: str, upload_id: str, part_number: int, data: bytes):
+        """Uploads one part and returns the record needed to commit it."""
+
+    @abstractmethod
+    def _commit_multipart(self, target_path: str, upload_id: str, parts: list):
+        """Completes a multipart upload from the records returned by _upload_part."""
+
+    @abstractmethod
+    def _abort_multipart(self, target_path: str, upload_id: str):
+        """Aborts a multipart upload, discarding its uploaded parts."""
@@ -24,10 +24,17 @@ class BucketContext:
         """
         Delegates attribute/method access to the underlying bucket service.
 
+        The resolved attribute is cached on the instance, so later accesses
+        are plain instance lookups and no longer go through this fallback.
+
         :param name: The attribute or method name.
         :return: The corresponding attribute or method from the bucket service.
         """
-        return getattr(self.bucket_service, name)
+        if name == "bucket_service":
+            raise AttributeError(name)
+        attr = getattr(self.bucket_service, name)
+        object.__setattr__(self, name, attr)
+        return attr
 
     def get_bucket_name(self) -> str:
         """
@@ -4,10 +4,102 @@ This module provides an implementation of BucketService for Oracle Cloud Infrast
 
 
 import io
+import os
 import datetime
-from typing import Union, Dict
+import functools
+import logging
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, Dict, Iterable, NamedTuple
 import oci
-from ._base import BucketService
+from oci.object_storage import UploadManager
+from oci.object_storage.models import (
+    CommitMultipartUploadDetails,
+    CommitMultipartUploadPartDetails,
+    CreateMultipartUploadDetails,
+)
+from ._base import (
+    BucketService,
+    SINGLE_PUT_LIMIT,
+    STREAM_PART_SIZE,
+    _check_part_size,
+    _item_size,
+)
+
+logger = logging.getLogger(__name__)
+
+# Local files above this size are uploaded as multipart in parts of this size.
+_MULTIPART_FILE_MIN = 64 * 1024 * 1024
+_UPLOAD_WORKERS = 8
+
+# Objects at least this large are downloaded as concurrent range GETs;
+# below it the extra requests cost more than they save.
+_RANGED_DOWNLOAD_MIN = 128 * 1024 * 1024
+_DOWNLOAD_WORKERS = 8
+_STREAM_CHUNK = 1024 * 1024
+_COPY_BUFFER = 4 * 1024 * 1024
+_DELETE_WORKERS = 32
+
+# Keep-alive connection pool size; covers the concurrent deletes and range GETs.
+_POOL_SIZE = 64
+
+
+class OCIConfig(NamedTuple):
+    """
+    Immutable OCI API Key credentials. Fields left empty are not passed to the SDK.
+    """
+    user: str = ""
+    tenancy: str = ""
+    region: str = ""
+    fingerprint: str = ""
+    key_content: str = ""
+
+    def to_sdk_config(self) -> Dict[str, str]:
+        """Returns the config dictionary expected by the OCI SDK."""
+        config = {
+            "user": self.user,
+            "tenancy": self.tenancy,
+            "region": self.region,
+            "fingerprint": self.fingerprint,
+            "key_content": self.key_content,
+        }
+        return {key: value for key, value in config.items() if value}
+
+
+@functools.lru_cache(maxsize=1)
+def get_instance_principals_signer():
+    """
+    Returns the process-wide Instance Principals signer.
+
+    The signer refreshes its own security token, so one instance serves every
+    bucket, and _get_oci_client (cached by signer) reuses one client for all of them.
+    """
+    return oci.auth.signers.InstancePrincipalsSecurityTokenSigner()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_oci_client(config: OCIConfig, signer=None):
+    """
+    Builds an ObjectStorageClient and resolves its namespace.
+
+    Results are cached per (config, signer) so that bucket objects sharing
+    credentials reuse one connection pool and skip the namespace round trip.
+
+    :param config: The API Key credentials.
+    :param signer: Optional signer for Instance Principals authentication.
+    :return: A (client, namespace) tuple.
+    """
+    if signer:
+        client = oci.object_storage.ObjectStorageClient({}, signer=signer)
+    else:
+        client = oci.object_storage.ObjectStorageClient(config.to_sdk_config())
+
+    # Remount the SDK's own adapter type so OCI-specific transport behavior is kept.
+    session = client.base_client.session
+    adapter_class = type(session.get_adapter("https://"))
+    session.mount("https://", adapter_class(
+        pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE))
+    return client, client.get_namespace().data
 
 
 class OCIBucket(BucketService):
@@ -16,12 +108,14 @@ class OCIBucket(BucketService):
     such as uploading, downloading, and deleting files.
     """
 
-    def __init__(self, bucket: str, config: Dict[str, str], signer=None):
+    __slots__ = ("config", "client", "namespace", "_url_prefix")
+
+    def __init__(self, bucket: str, config: Union[OCIConfig, Dict[str, str]], signer=None):
         """
         Initializes the OCI bucket service.
 
         :param bucket: The bucket name.
-        :param config: Dictionary containing:
+        :param config: OCIConfig, or a dictionary containing:
             - user
             - tenancy
             - region
@@ -31,32 +125,42 @@ class OCIBucket(BucketService):
         """
         super().__init__(bucket)
         self.bucket = bucket
-        self.config = config
+        self.config = config if isinstance(config, OCIConfig) else OCIConfig(**config)
         self.client = None
         self.namespace = None
 
         try:
             if signer:
-                print("Using Instance Principals authentication.")
-                self.client = oci.object_storage.ObjectStorageClient(
-                    {}, signer=signer)
+                logger.debug("OCI init using Instance Principals authentication")
             else:
-                print("Using API Key authentication.")
-                print(self.config)
-                self.client = oci.object_storage.ObjectStorageClient(
-                    self.config)
+                logger.debug("OCI init region=%s user=%s",
+                             self.config.region, self.config.user)
 
-            self.namespace = self.client.get_namespace().data
+            self.client, self.namespace = _get_oci_client(self.config, signer)
+            # PAR access URIs are absolute paths on the regional endpoint.
+            self._url_prefix = self.client.base_client.get_endpoint().rstrip("/")
         except Exception as e:
             raise RuntimeError(
                 f"Failed to initialize OCI Object Storage client: {e}") from e
 
     def upload_item(self, target_path: str, item: Union[bytes, io.BytesIO]):
         """Uploads a file (bytes or stream) to the bucket."""
-        if isinstance(item, bytes):
-            item = io.BytesIO(item)
+        size = _item_size(item)
         try:
-            return self.client.put_object(self.namespace, self.bucket, target_path, item)
+            if size is not None and size <= SINGLE_PUT_LIMIT:
+                # The SDK accepts bytes or readable streams, but not bytearray.
+                if isinstance(item, bytearray):
+                    item = bytes(item)
+                return self.client.put_object(self.namespace, self.bucket, target_path, item)
+
+            if isinstance(item, (bytes, bytearray)):
+                item = io.BytesIO(item)
+            upload_manager = UploadManager(
+                self.client, allow_parallel_uploads=True,
+                parallel_process_count=_UPLOAD_WORKERS)
+            return upload_manager.upload_stream(
+                self.namespace, self.bucket, target_path, item,
+                part_size=SINGLE_PUT_LIMIT)
         except Exception as e:
             raise RuntimeError(
                 f"Upload failed for {target_path}: {e}") from e
@@ -64,11 +168,52 @@ class OCIBucket(BucketService):
     def upload_file(self, source_path: str, target_path: str):
         """Uploads a local file to the bucket."""
         try:
-            with open(source_path, "rb", encoding="utf-8") as f:  # Specify encoding
+            if os.path.getsize(source_path) > _MULTIPART_FILE_MIN:
+                upload_manager = UploadManager(
+                    self.client, allow_parallel_uploads=True,
+                    parallel_process_count=_UPLOAD_WORKERS)
+                return upload_manager.upload_file(
+                    self.namespace, self.bucket, target_path, source_path,
+                    part_size=_MULTIPART_FILE_MIN)
+
+            with open(source_path, "rb") as f:
                 return self.client.put_object(self.namespace, self.bucket, target_path, f)
         except Exception as e:
             raise RuntimeError(f"File upload failed: {e}") from e
 
+    def upload_stream(self, target_path: str, chunk_iter: Iterable[bytes],
+                      part_size: int = STREAM_PART_SIZE):
+        """Uploads chunks as they are produced, switching to multipart after the first full part."""
+        _check_part_size(part_size)
+        try:
+            return self._upload_parts(target_path, chunk_iter, part_size)
+        except Exception as e:
+            raise RuntimeError(
+                f"Stream upload failed for {target_path}: {e}") from e
+
+    def _put_single(self, target_path: str, data: bytes):
+        return self.client.put_object(self.namespace, self.bucket, target_path, data)
+
+    def _create_multipart(self, target_path: str):
+        response = self.client.create_multipart_upload(
+            self.namespace, self.bucket, CreateMultipartUploadDetails(object=target_path))
+        return response.data.upload_id
+
+    def _upload_part(self, target_path: str, upload_id: str, part_number: int, data: bytes):
+        response = self.client.upload_part(
+            self.namespace, self.bucket, target_path, upload_id, part_number, data)
+        return CommitMultipartUploadPartDetails(
+            part_num=part_number, etag=response.headers["etag"])
+
+    def _commit_multipart(self, target_path: str, upload_id: str, parts: list):
+        return self.client.commit_multipart_upload(
+            self.namespace, self.bucket, target_path, upload_id,
+            CommitMultipartUploadDetails(parts_to_commit=parts))
+
+    def _abort_multipart(self, target_path: str, upload_id: str):
+        self.client.abort_multipart_upload(
+            self.namespace, self.bucket, target_path, upload_id)
+
     def delete_file(self, target_path: str):
         """Deletes a file from the bucket."""
         try:
@@ -82,22 +227,49 @@ class OCIBucket(BucketService):
         try:
             response = self.client.get_object(
                 self.namespace, self.bucket, target)
-            return response.data.content
+            chunks = response.data.raw.stream(_STREAM_CHUNK, decode_content=False)
+            size = response.headers.get("content-length")
+            if size is None:
+                buffer = bytearray()
+                for chunk in chunks:
+                    buffer += chunk
+                return bytes(buffer)
+
+            # Fill a preallocated buffer to avoid repeated reallocation.
+            buffer = bytearray(int(size))
+            view = memoryview(buffer)
+            offset = 0
+            for chunk in chunks:
+                view[offset:offset + len(chunk)] = chunk
+                offset += len(chunk)
+            return bytes(buffer)
         except Exception as e:
             raise RuntimeError(f"Failed to read file {target}: {e}") from e
 
     def list_folder(self, folder_path: str):
-        """Lists all objects in a folder (prefix match)."""
+        """Lists all objects in a folder (prefix match), following pagination."""
         try:
-            response = self.client.list_objects(
-                self.namespace, self.bucket, prefix=folder_path)
-            return [obj.name for obj in response.data.objects] if response.data.objects else []
+            return list(self._iter_folder(folder_path))
         except Exception as e:
             raise RuntimeError(
                 f"Failed to list folder {folder_path}: {e}") from e
 
+    def _iter_folder(self, folder_path: str):
+        """Yields the names of all objects in a folder, one listing page at a time."""
+        start = None
+        while True:
+            response = self.client.list_objects(
+                self.namespace, self.bucket, prefix=folder_path, start=start)
+            yield from (obj.name for obj in response.data.objects or [])
+            start = response.data.next_start_with
+            if start is None:
+                return
+
     def generate_url(self, target: str, expiration=3600):
-        """Generates a pre-authenticated URL to access a file."""
+        """Generates a pre-authenticated URL to access a file, reusing a cached one when fresh."""
+        url = self._url_cache.get(target, expiration)
+        if url is not None:
+            return url
         try:
             expiration_time = datetime.datetime.utcnow(
             ) + datetime.timedelta(seconds=expiration)
@@ -112,36 +284,79 @@ class OCIBucket(BucketService):
                 bucket_name=self.bucket,
                 create_preauthenticated_request_details=par_details,
             )
-
-            base_endpoint = f"https://objectstorage.{self.config['region']}.oraclecloud.com"
-
-            base_url = f"{base_endpoint}/n/{self.namespace}/b/{self.bucket}/o"
-            return f"{base_url}{response.data.access_uri}"
+            url = f"{self._url_prefix}{response.data.access_uri}"
         except Exception as e:
             raise RuntimeError(
                 f"Failed to generate URL for {target}: {e}") from e
+        self._url_cache.put(target, expiration, url)
+        return url
 
     def download_file(self, target_path: str, local_path: str):
         """Downloads a file from OCI Object Storage and saves it locally."""
         try:
+            head = self.client.head_object(
+                self.namespace, self.bucket, target_path)
+            size = int(head.headers["content-length"])
+            if size >= _RANGED_DOWNLOAD_MIN and hasattr(os, "pwrite"):
+                self._download_ranges(
+                    target_path, local_path, size, head.headers.get("etag"))
+                return head
+
             response = self.client.get_object(
                 self.namespace, self.bucket, target_path)
+            raw = response.data.raw
+            raw.decode_content = False
             with open(local_path, "wb") as file:
-                for chunk in response.data.raw.stream(1024 * 1024, decode_content=False):
-                    file.write(chunk)
-            return response
+                shutil.copyfileobj(raw, file, _COPY_BUFFER)
+            # Both paths return the object's metadata; the body has been consumed.
+            return head
         except Exception as e:
             raise RuntimeError(
                 f"Download failed for {target_path}: {e}") from e
 
+    def _download_ranges(self, target_path: str, local_path: str, size: int, etag=None):
+        """
+        Downloads an object as concurrent byte ranges into a preallocated file.
+        The file is removed if any range fails, since its unwritten gaps are zero-filled.
+        """
+        part_size = -(-size // _DOWNLOAD_WORKERS)
+
+        def fetch_range(fd: int, start: int):
+            end = min(start + part_size, size) - 1
+            response = self.client.get_object(
+                self.namespace, self.bucket, target_path,
+                range=f"bytes={start}-{end}", if_match=etag)
+            offset = start
+            for chunk in response.data.raw.stream(_STREAM_CHUNK, decode_content=False):
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+
+        fd = os.open(local_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                if hasattr(os, "posix_fallocate"):
+                    os.posix_fallocate(fd, 0, size)
+                else:
+                    os.ftruncate(fd, size)
+                with ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS) as executor:
+                    list(executor.map(functools.partial(fetch_range, fd),
+                                      range(0, size, part_size)))
+            finally:
+                os.close(fd)
+        except BaseException:
+            os.unlink(local_path)
+            raise
+
     def delete_folder(self, folder_path: str):
         """Deletes all objects in a given folder (prefix match)."""
         try:
-            objects_to_delete = self.list_folder(folder_path)
-            if objects_to_delete:
-                for obj_name in objects_to_delete:
-                    self.client.delete_object(
-                        self.namespace, self.bucket, obj_name)
+            # Deletes are submitted page by page while the listing continues.
+            objects_to_delete = self._iter_folder(folder_path)
+            with ThreadPoolExecutor(max_workers=_DELETE_WORKERS) as executor:
+                list(executor.map(
+                    lambda obj_name: self.client.delete_object(
+                        self.namespace, self.bucket, obj_name),
+                    objects_to_delete))
         except Exception as e:
             raise RuntimeError(
                 f"Failed to delete folder {folder_path}: {e}") from e
@@ -3,9 +3,96 @@ This module provides an implementation of BucketService for Amazon S3.
 """
 
 import io
-from typing import Union, Dict
+import os
+import mmap
+import functools
+from typing import Union, Dict, Iterable, NamedTuple, Optional
 import boto3
-from ._base import BucketService
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from ._base import (
+    BucketService,
+    SINGLE_PUT_LIMIT,
+    STREAM_PART_SIZE,
+    _check_part_size,
+    _item_size,
+)
+from ._s3_presign import S3Presigner
+
+
+# Larger connection pool than botocore's default of 10 so concurrent
+# transfers don't queue for connections, with keep-alive on idle sockets.
+DEFAULT_MAX_POOL_CONNECTIONS = 64
+
+
+@functools.lru_cache(maxsize=8)
+def build_boto_config(max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+                      tcp_keepalive: bool = True) -> Config:
+    """
+    Returns the botocore client Config used for S3 clients.
+
+    Configs are cached so equal settings yield the same object, which lets
+    clients built from them be shared through the client cache.
+
+    :param max_pool_connections: Size of the urllib3 connection pool.
+    :param tcp_keepalive: Whether to enable TCP keep-alive on connections.
+    """
+    return Config(
+        max_pool_connections=max_pool_connections,
+        tcp_keepalive=tcp_keepalive,
+        retries={"mode": "adaptive", "max_attempts": 10},
+        s3={"use_accelerate_endpoint": False, "addressing_style": "virtual"},
+    )
+
+# Larger parts and more concurrent workers than boto3's defaults
+# (8MB / 10 threads), which bottleneck managed transfers on fast links.
+_TRANSFER_CFG = TransferConfig(
+    multipart_threshold=64 * 1024 * 1024,
+    multipart_chunksize=64 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True,
+)
+
+# Managed transfer settings for upload_item payloads above SINGLE_PUT_LIMIT.
+_ITEM_TRANSFER_CFG = TransferConfig(
+    multipart_threshold=SINGLE_PUT_LIMIT,
+    multipart_chunksize=SINGLE_PUT_LIMIT,
+    max_concurrency=8,
+)
+
+# Files from this size up to the multipart threshold are sent as a single
+# PutObject read from a memory map; S3 caps a single PUT at 5GB.
+_MMAP_PUT_MIN = 8 * 1024 * 1024
+_SINGLE_PUT_MAX = 5 * 1024 * 1024 * 1024
+
+# Maximum number of keys accepted by a single DeleteObjects request.
+_DELETE_BATCH = 1000
+
+
+class S3Config(NamedTuple):
+    """
+    Immutable AWS credentials and region for an S3 bucket.
+    """
+    aws_access_key_id: str
+    aws_secret_access_key: str
+    region: str
+
+
+@functools.lru_cache(maxsize=32)
+def _get_s3_client(config: S3Config, boto_config: Config):
+    """
+    Builds an S3 client, cached per credentials, region and client config so
+    that bucket objects sharing them reuse one connection pool.
+
+    Each client gets its own Session since boto3 sessions are not thread-safe.
+    """
+    return boto3.session.Session().client(
+        "s3",
+        aws_access_key_id=config.aws_access_key_id,
+        aws_secret_access_key=config.aws_secret_access_key,
+        region_name=config.region,
+        config=boto_config,
+    )
 
 
 class S3Bucket(BucketService):
@@ -13,34 +100,87 @@ class S3Bucket(BucketService):
     Implementation of BucketService for AWS S3.
     """
 
-    def __init__(self, bucket: str, config: Dict[str, str]):
+    __slots__ = ("config", "client", "transfer_config", "_presigner")
+
+    def __init__(self, bucket: str, config: Union[S3Config, Dict[str, str]],
+                 transfer_config: Optional[TransferConfig] = None,
+                 boto_config: Optional[Config] = None):
         """
         Initializes the S3 bucket service.
 
         :param bucket: The S3 bucket name.
-        :param config: Dictionary containing:
+        :param config: S3Config, or a dictionary containing:
             - aws_access_key_id
             - aws_secret_access_key
             - region
+        :param transfer_config: Optional TransferConfig overriding the default
+            multipart settings used by upload_file and download_file.
+        :param boto_config: Optional botocore Config for the client
+            (default: build_boto_config()).
         """
         super().__init__(bucket)
 
-        self.config = config
+        self.config = config if isinstance(config, S3Config) else S3Config(**config)
         self.bucket = bucket
-        self.client = boto3.client(
-            "s3",
-            aws_access_key_id=self.config["aws_access_key_id"],
-            aws_secret_access_key=self.config["aws_secret_access_key"],
-            region_name=self.config["region"],
-        )
+        self.transfer_config = transfer_config or _TRANSFER_CFG
+        self.client = _get_s3_client(
+            self.config, boto_config or build_boto_config(DEFAULT_MAX_POOL_CONNECTIONS, True))
+        self._presigner = None
+        if S3Presigner.supports(bucket, self.config.region):
+            self._presigner = S3Presigner(
+                bucket, self.config.region,
+                self.config.aws_access_key_id, self.config.aws_secret_access_key)
 
     def upload_item(self, target_path: str, item: Union[bytes, io.BytesIO]):
-        if isinstance(item, bytes):
+        size = _item_size(item)
+        if size is not None and size <= SINGLE_PUT_LIMIT:
+            return self.client.put_object(Bucket=self.bucket, Key=target_path, Body=item)
+
+        if isinstance(item, (bytes, bytearray)):
             item = io.BytesIO(item)
-        return self.client.put_object(Bucket=self.bucket, Key=target_path, Body=item)
+        return self.client.upload_fileobj(
+            item, self.bucket, target_path, Config=_ITEM_TRANSFER_CFG)
 
     def upload_file(self, source_path: str, target_path: str):
-        return self.client.upload_file(Filename=source_path, Bucket=self.bucket, Key=target_path)
+        size = os.path.getsize(source_path)
+        single_put_max = min(self.transfer_config.multipart_threshold, _SINGLE_PUT_MAX)
+        if _MMAP_PUT_MIN <= size < single_put_max:
+            with open(source_path, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                self.client.put_object(Bucket=self.bucket, Key=target_path, Body=mm)
+            # Like client.upload_file below, which returns None.
+            return None
+
+        return self.client.upload_file(
+            Filename=source_path, Bucket=self.bucket, Key=target_path,
+            Config=self.transfer_config)
+
+    def upload_stream(self, target_path: str, chunk_iter: Iterable[bytes],
+                      part_size: int = STREAM_PART_SIZE):
+        _check_part_size(part_size)
+        return self._upload_parts(target_path, chunk_iter, part_size)
+
+    def _put_single(self, target_path: str, data: bytes):
+        return self.client.put_object(Bucket=self.bucket, Key=target_path, Body=data)
+
+    def _create_multipart(self, target_path: str):
+        response = self.client.create_multipart_upload(Bucket=self.bucket, Key=target_path)
+        return response["UploadId"]
+
+    def _upload_part(self, target_path: str, upload_id: str, part_number: int, data: bytes):
+        response = self.client.upload_part(
+            Bucket=self.bucket, Key=target_path, UploadId=upload_id,
+            PartNumber=part_number, Body=data)
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    def _commit_multipart(self, target_path: str, upload_id: str, parts: list):
+        return self.client.complete_multipart_upload(
+            Bucket=self.bucket, Key=target_path, UploadId=upload_id,
+            MultipartUpload={"Parts": parts})
+
+    def _abort_multipart(self, target_path: str, upload_id: str):
+        self.client.abort_multipart_upload(
+            Bucket=self.bucket, Key=target_path, UploadId=upload_id)
 
     def delete_file(self, target_path: str):
         return self.client.delete_object(Bucket=self.bucket, Key=target_path)
@@ -50,23 +190,31 @@ class S3Bucket(BucketService):
         return response["Body"].read()
 
     def list_folder(self, folder_path: str):
-        response = self.client.list_objects_v2(
-            Bucket=self.bucket, Prefix=folder_path)
-        return [content["Key"] for content in response.get("Contents", [])]
+        paginator = self.client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(Bucket=self.bucket, Prefix=folder_path)
+        return [content["Key"] for page in pages for content in page.get("Contents", [])]
 
     def generate_url(self, target: str, expiration=3600):
-        return self.client.generate_presigned_url(
-            "get_object", Params={"Bucket": self.bucket, "Key": target}, ExpiresIn=expiration
-        )
+        url = self._url_cache.get(target, expiration)
+        if url is None:
+            if self._presigner is not None:
+                url = self._presigner.presign_get(target, expiration)
+            else:
+                url = self.client.generate_presigned_url(
+                    "get_object", Params={"Bucket": self.bucket, "Key": target},
+                    ExpiresIn=expiration)
+            self._url_cache.put(target, expiration, url)
+        return url
 
     def download_file(self, target_path: str, local_path: str):
-        return self.client.download_file(self.bucket, target_path, local_path)
+        return self.client.download_file(
+            self.bucket, target_path, local_path, Config=self.transfer_config)
 
     def delete_folder(self, folder_path: str):
         objects_to_delete = self.list_folder(folder_path)
-        if objects_to_delete:
+        for start in range(0, len(objects_to_delete), _DELETE_BATCH):
+            batch = objects_to_delete[start:start + _DELETE_BATCH]
             self.client.delete_objects(
                 Bucket=self.bucket,
-                Delete={"Objects": [{"Key": obj}
-                                    for obj in objects_to_delete]},
+                Delete={"Objects": [{"Key": obj} for obj in batch]},
             )
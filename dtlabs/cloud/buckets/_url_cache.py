@@ -0,0 +1,63 @@
+"""
+This module provides a thread-safe cache for signed URLs, so repeated requests
+for the same object reuse an existing URL instead of signing a new one.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class URLCache:
+    """
+    LRU cache of signed URLs keyed by (target, expiration).
+
+    A cached URL is only handed out while at least half of its requested
+    lifetime remains, so callers never receive a URL about to expire.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Initializes an empty cache.
+
+        :param maxsize: Maximum number of URLs kept before evicting the least recently used.
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, target: str, expiration: int) -> Optional[str]:
+        """
+        Returns a cached URL for the target, if one is still fresh enough.
+
+        :param target: The file path in the bucket.
+        :param expiration: The expiration time in seconds the URL was requested with.
+        :return: The cached URL, or None.
+        """
+        key = (target, expiration)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            url, reuse_until = entry
+            if time.monotonic() >= reuse_until:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return url
+
+    def put(self, target: str, expiration: int, url: str):
+        """
+        Stores a freshly signed URL.
+
+        :param target: The file path in the bucket.
+        :param expiration: The expiration time in seconds the URL was signed with.
+        :param url: The signed URL.
+        """
+        key = (target, expiration)
+        with self._lock:
+            self._entries[key] = (url, time.monotonic() + expiration / 2)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
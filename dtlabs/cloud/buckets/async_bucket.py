@@ -0,0 +1,103 @@
+"""
+This module defines the AsyncBucket class, an asyncio front-end for bucket services
+that lets fan-out workloads (many uploads, reads or deletes) run from one event loop.
+"""
+
+import asyncio
+import functools
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Tuple, Union
+
+
+class AsyncBucket:
+    """
+    Exposes the BucketService operations as coroutines.
+
+    Each call runs the underlying blocking SDK call on a dedicated thread pool,
+    so many requests can be in flight at once without blocking the event loop.
+    Works with any BucketService implementation or a Bucket instance.
+    """
+
+    def __init__(self, bucket_service, max_workers: int = 64):
+        """
+        Initializes the async wrapper.
+
+        :param bucket_service: A Bucket or an instance of a class implementing BucketService.
+        :param max_workers: Maximum number of SDK calls running concurrently.
+        """
+        self.bucket_service = bucket_service
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def close(self):
+        """Waits for pending calls and releases the worker threads."""
+        self._executor.shutdown(wait=True)
+
+    async def aclose(self):
+        """Like close, but waits for pending calls without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    async def _run(self, func, *args, **kwargs):
+        """Runs a blocking call on the worker pool and awaits its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+
+    async def upload_item(self, target_path: str, item: Union[bytes, io.BytesIO]):
+        """Uploads an item (bytes or stream) to the bucket."""
+        return await self._run(self.bucket_service.upload_item, target_path, item)
+
+    async def upload_file(self, source_path: str, target_path: str):
+        """Uploads a local file to the bucket."""
+        return await self._run(self.bucket_service.upload_file, source_path, target_path)
+
+    async def upload_stream(self, target_path: str, chunk_iter: Iterable[bytes], **kwargs):
+        """Uploads data from an iterator of byte chunks without buffering it all."""
+        return await self._run(self.bucket_service.upload_stream, target_path, chunk_iter, **kwargs)
+
+    async def delete_file(self, target_path: str):
+        """Deletes a file from the bucket."""
+        return await self._run(self.bucket_service.delete_file, target_path)
+
+    async def read_file(self, target: str):
+        """Reads a file from the bucket and returns its content as bytes."""
+        return await self._run(self.bucket_service.read_file, target)
+
+    async def list_folder(self, folder_path: str):
+        """Lists the files inside a folder in the bucket."""
+        return await self._run(self.bucket_service.list_folder, folder_path)
+
+    async def generate_url(self, target: str, expiration=3600):
+        """Generates a signed URL for accessing a file in the bucket."""
+        return await self._run(self.bucket_service.generate_url, target, expiration)
+
+    async def download_file(self, target_path: str, local_path: str):
+        """Downloads a file from the bucket to the local system."""
+        return await self._run(self.bucket_service.download_file, target_path, local_path)
+
+    async def delete_folder(self, folder_path: str):
+        """Deletes a folder and all its contents from the bucket."""
+        return await self._run(self.bucket_service.delete_folder, folder_path)
+
+    async def bulk_upload(self, paths: List[Tuple[str, str]], concurrency: int = 64):
+        """
+        Uploads many local files concurrently.
+
+        :param paths: A list of (source_path, target_path) tuples.
+        :param concurrency: Maximum number of uploads in flight at once.
+        :return: The upload results, in the same order as paths.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def upload(source_path: str, target_path: str):
+            async with semaphore:
+                return await self.upload_file(source_path, target_path)
+
+        return await asyncio.gather(*(upload(source, target) for source, target in paths))
@@ -4,20 +4,150 @@ for AWS S3 and OCI Object Storage.
 """
 
 import os
-from typing import Dict
+import logging
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional
 
 import requests
-import oci
+from requests.adapters import HTTPAdapter
 
 from ._bucket_context import BucketContext
-from ._s3_bucket import S3Bucket
-from ._oci_bucket import OCIBucket
+
+logger = logging.getLogger(__name__)
+
+# Provider modules (and their SDKs) are imported only when that provider is
+# selected, so using one provider doesn't pay the import cost of the other.
+# pylint: disable=import-outside-toplevel
+
+# Bucket services shared by every Bucket built with the same provider, bucket,
+# resolved credentials and client settings, so repeated constructions reuse one
+# client and connection pool. Least recently used services are evicted first.
+_SERVICE_CACHE: "OrderedDict[Hashable, Any]" = OrderedDict()
+_SERVICE_CACHE_SIZE = 32
+_SERVICE_CACHE_LOCK = threading.Lock()
+
+
+def _cached_service(key: Hashable, build: Callable[[], Any]):
+    """
+    Returns the service cached under key, building and caching it on a miss.
+
+    :param key: The provider, bucket, resolved config and client settings.
+    :param build: Called without arguments to create the service.
+    """
+    with _SERVICE_CACHE_LOCK:
+        service = _SERVICE_CACHE.get(key)
+        if service is not None:
+            _SERVICE_CACHE.move_to_end(key)
+            return service
+
+    service = build()
+    with _SERVICE_CACHE_LOCK:
+        service = _SERVICE_CACHE.setdefault(key, service)
+        _SERVICE_CACHE.move_to_end(key)
+        while len(_SERVICE_CACHE) > _SERVICE_CACHE_SIZE:
+            _SERVICE_CACHE.popitem(last=False)
+    return service
+
+
+def _settings_key(settings) -> Optional[tuple]:
+    """Returns a hashable snapshot of a settings object's attributes, such as a TransferConfig."""
+    if settings is None:
+        return None
+    return tuple(sorted((name, repr(value)) for name, value in vars(settings).items()))
+
+# OCIConfig field -> Bucket keyword argument (and _OCIEnv field) supplying it.
+_OCI_KEY_MAP = {
+    "user": "user_ocid",
+    "tenancy": "tenancy_ocid",
+    "region": "region",
+    "fingerprint": "fingerprint",
+    "key_content": "private_key",
+}
+
+_OCI_AUTH_MODES = ("instance_principal", "config")
+
+
+class _OCIEnv(NamedTuple):
+    """OCI credentials read from the environment, with the private key already normalized."""
+    user_ocid: Optional[str]
+    tenancy_ocid: Optional[str]
+    region: Optional[str]
+    fingerprint: Optional[str]
+    private_key: Optional[str]
+    auth_mode: Optional[str]
+
+
+def _normalize_private_key(private_key: Optional[str]) -> Optional[str]:
+    """Restores newlines escaped as \\n, as found in env files."""
+    return private_key.replace("\\n", "\n") if private_key else private_key
+
+
+@functools.lru_cache(maxsize=4)
+def _read_key(path: str, _mtime: float) -> str:
+    """
+    Reads a private key file. The modification time is part of the cache key,
+    so a rewritten key file is read again while unchanged ones are not.
+    """
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=1)
+def _oci_env() -> _OCIEnv:
+    """
+    Reads the OCI_* environment variables once per process.
+    Resolved on first use rather than at import, so env files loaded after import are honored.
+    """
+    return _OCIEnv(
+        user_ocid=os.getenv("OCI_USER_OCID"),
+        tenancy_ocid=os.getenv("OCI_TENANCY_OCID"),
+        region=os.getenv("OCI_REGION"),
+        fingerprint=os.getenv("OCI_FINGERPRINT"),
+        private_key=_normalize_private_key(os.getenv("OCI_PRIVATE_KEY")),
+        auth_mode=os.getenv("OCI_AUTH_MODE"),
+    )
+
+
+_CGROUP_MARKERS = (b"docker", b"containerd", b"kubepods")
+
+_IMDS_URL = "http://169.254.169.254/opc/v2/identity/"
+
+# Single keep-alive connection to the instance metadata service.
+_IMDS_SESSION = requests.Session()
+_IMDS_SESSION.mount("http://169.254.169.254/", HTTPAdapter(
+    pool_connections=1, pool_maxsize=1, max_retries=0))
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_oci_env() -> bool:
+    """
+    Checks if the process is running inside an OCI instance.
+
+    The result is memoized for the process lifetime. Setting OCI_INSTANCE_PRINCIPAL
+    to 1 or 0 skips the metadata service probe entirely.
+    """
+    override = os.getenv("OCI_INSTANCE_PRINCIPAL")
+    if override is not None:
+        return override.strip().lower() in ("1", "true", "yes")
+
+    try:
+        response = _IMDS_SESSION.get(_IMDS_URL, timeout=(0.2, 0.5))
+        return response.status_code == 200
+    except requests.RequestException:
+        return False
 
 
 class Bucket(BucketContext):
     """
     A class to manage cloud storage operations for AWS S3 and OCI Object Storage.
 
+    OCI credentials are taken from the user_ocid, tenancy_ocid, region, fingerprint
+    and private_key (or key_path, a private key file) keyword arguments, falling
+    back to the matching OCI_* environment variables. auth_mode (or OCI_AUTH_MODE)
+    set to 'instance_principal' or 'config' skips detecting whether we run inside OCI.
+
     Attributes:
         bucket (str): The name of the storage bucket.
         provider (str): The cloud provider ('AWS' or 'OCI').
@@ -32,62 +162,73 @@ class Bucket(BucketContext):
         super().__init__(self.service)
 
     def _initialize_service(self, bucket: str, provider: str, **kwargs):
-        """Initializes the appropriate bucket service based on the provider."""
-        if provider == "OCI":
-            return self._initialize_oci(bucket, **kwargs)
-        if provider == "AWS":
-            return self._initialize_aws(bucket, **kwargs)
-        raise ValueError(
-            f"Provider '{provider}' not supported. Use 'AWS' or 'OCI'.")
+        """
+        Initializes the appropriate bucket service based on the provider,
+        reusing a cached service built earlier with the same resolved credentials.
+        """
+        try:
+            initialize = self._PROVIDERS[provider]
+        except KeyError:
+            raise ValueError(
+                f"Provider '{provider}' not supported. Use 'AWS' or 'OCI'.") from None
+        return initialize(self, bucket, **kwargs)
 
     def _initialize_oci(self, bucket: str, **kwargs):
         """Initializes OCI Object Storage only if provider is OCI."""
         if self.provider != "OCI":
             return None
 
-        if self._is_running_in_oci():
-            print("✅ Running inside OCI. Using Instance Principals authentication.")
-            signer = oci.auth.signers.InstancePrincipalsSecurityTokenSigner()
-            return OCIBucket(bucket=bucket, config={}, signer=signer)
+        from ._oci_bucket import OCIBucket, OCIConfig, get_instance_principals_signer
+
+        # An explicit auth mode skips probing the instance metadata service.
+        env = _oci_env()
+        auth_mode = kwargs.get("auth_mode", env.auth_mode)
+        if auth_mode not in (None, "", *_OCI_AUTH_MODES):
+            raise ValueError(
+                f"❌ Invalid OCI auth mode '{auth_mode}'. Use one of {list(_OCI_AUTH_MODES)}.")
+        if auth_mode:
+            use_instance_principals = auth_mode == "instance_principal"
+        else:
+            use_instance_principals = _detect_oci_env()
 
-        print("🌍 Running locally or in a container. Using config file authentication.")
+        if use_instance_principals:
+            logger.debug("Running inside OCI. Using Instance Principals authentication.")
+
+            def build():
+                signer = get_instance_principals_signer()
+                return OCIBucket(bucket=bucket, config=OCIConfig(region=signer.region),
+                                 signer=signer)
+
+            return _cached_service(("OCI", bucket, "instance_principal"), build)
+
+        logger.debug("Running locally or in a container. Using config file authentication.")
 
         # Load environment variables if not provided explicitly
-        kwargs.setdefault("user_ocid", os.getenv("OCI_USER_OCID"))
-        kwargs.setdefault("tenancy_ocid", os.getenv("OCI_TENANCY_OCID"))
-        kwargs.setdefault("region", os.getenv("OCI_REGION"))
-        kwargs.setdefault("fingerprint", os.getenv("OCI_FINGERPRINT"))
-        private_key = kwargs.setdefault(
-            "private_key", os.getenv("OCI_PRIVATE_KEY"))
-
-        # Ensure private key formatting is correct
-        if private_key:
-            private_key = private_key.replace(
-                "\\n", "\n")  # Fix escaped newlines
-            kwargs["private_key"] = private_key
+        values = {field: kwargs.get(alias, getattr(env, alias))
+                  for field, alias in _OCI_KEY_MAP.items()}
+        if kwargs.get("private_key"):
+            values["key_content"] = _normalize_private_key(values["key_content"])
+        elif kwargs.get("key_path"):
+            key_path = kwargs["key_path"]
+            values["key_content"] = _read_key(key_path, os.path.getmtime(key_path))
 
         # Check for missing keys
-        required_keys = ["user_ocid", "tenancy_ocid",
-                         "region", "fingerprint", "private_key"]
-        missing_keys = [key for key in required_keys if not kwargs.get(key)]
+        missing_keys = [_OCI_KEY_MAP[field] for field, value in values.items() if not value]
         if missing_keys:
             raise ValueError(
                 f"❌ Missing required parameters for OCI: {missing_keys}")
 
-        config: Dict[str, str] = {
-            "user": kwargs["user_ocid"],
-            "tenancy": kwargs["tenancy_ocid"],
-            "region": kwargs["region"],
-            "fingerprint": kwargs["fingerprint"],
-            "key_content": kwargs["private_key"],
-        }
-        return OCIBucket(bucket=bucket, config=config)
+        config = OCIConfig(**values)
+        return _cached_service(("OCI", bucket, config),
+                               lambda: OCIBucket(bucket=bucket, config=config))
 
     def _initialize_aws(self, bucket: str, **kwargs):
         """Initializes AWS S3 bucket only if provider is AWS."""
         if self.provider != "AWS":
             return None
 
+        from ._s3_bucket import S3Bucket, S3Config, build_boto_config, DEFAULT_MAX_POOL_CONNECTIONS
+
         kwargs.setdefault("aws_access_key_id", os.getenv("AWS_ACCESS_KEY_ID"))
         kwargs.setdefault("aws_secret_access_key",
                           os.getenv("AWS_SECRET_ACCESS_KEY"))
@@ -101,12 +242,23 @@ class Bucket(BucketContext):
             raise ValueError(
                 f"❌ Missing required parameters for AWS: {missing_keys}")
 
-        config: Dict[str, str] = {
-            "aws_access_key_id": kwargs["aws_access_key_id"],
-            "aws_secret_access_key": kwargs["aws_secret_access_key"],
-            "region": kwargs["region"],
-        }
-        return S3Bucket(bucket=bucket, config=config)
+        config = S3Config(
+            aws_access_key_id=kwargs["aws_access_key_id"],
+            aws_secret_access_key=kwargs["aws_secret_access_key"],
+            region=kwargs["region"],
+        )
+        max_pool_connections = int(
+            kwargs.get("max_pool_connections", DEFAULT_MAX_POOL_CONNECTIONS))
+        tcp_keepalive = bool(kwargs.get("tcp_keepalive", True))
+        transfer_config = kwargs.get("transfer_config")
+        key = ("AWS", bucket, config, max_pool_connections, tcp_keepalive,
+               _settings_key(transfer_config))
+        return _cached_service(key, lambda: S3Bucket(
+            bucket=bucket, config=config, transfer_config=transfer_config,
+            boto_config=build_boto_config(max_pool_connections, tcp_keepalive)))
+
+    # Provider name -> service initializer.
+    _PROVIDERS = {"OCI": _initialize_oci, "AWS": _initialize_aws}
 
     def __repr__(self):
         return f"Bucket(provider={self.provider}, bucket={self.bucket})"
@@ -120,22 +272,12 @@ class Bucket(BucketContext):
         """
         return {"bucket": self.bucket, "provider": self.provider}
 
-    @staticmethod
-    def _is_running_in_oci():
-        """Checks if the script is running inside an OCI instance."""
-        try:
-            response = requests.get(
-                "http://169.254.169.254/opc/v2/identity/", timeout=2)
-            return response.status_code == 200
-        except requests.RequestException:
-            return False
-
     @staticmethod
     def _is_running_in_container():
         """Checks if the script is running inside a Docker container."""
         path = "/proc/1/cgroup"
-        return (
-            os.path.exists(path) and any(
-                "docker" in line or "containerd" in line or "kubepods" in line
-                for line in open(path, encoding="utf-8"))
-        )
+        if not os.path.exists(path):
+            return False
+        with open(path, "rb") as f:
+            data = f.read()
+        return any(marker in data for marker in _CGROUP_MARKERS)
@@ -1,3 +1,3 @@
 from dtlabs.rpc.rmq._base_message import Message
-from dtlabs.rpc.rmq._client import RPCClient
+from dtlabs.rpc.rmq._client import RPCClient, get_client
 from dtlabs.rpc.rmq._server import RPCServer
@@ -1,9 +1,8 @@
-from abc import ABC, abstractmethod
+from pydantic import BaseModel, ConfigDict
 
-import json
-from pydantic import BaseModel
 
+class Message(BaseModel):
+    model_config = ConfigDict(frozen=True)
 
-class Message(ABC, BaseModel):
-    def dumps(self):
-        return json.dumps(self.json())
+    def dumps(self) -> bytes:
+        return self.__pydantic_serializer__.to_json(self)
@@ -1,9 +1,11 @@
-import json
 import pika
-import uuid
-from typing import Any, Union
+import secrets
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from dtlabs.rpc.rmq._base_message import Message
+from dtlabs.rpc.rmq._codec import decode_response
 
 class RPCClient:
     def __init__(self, host: str):
@@ -20,27 +22,75 @@ class RPCClient:
             auto_ack=True
         )
 
-        self.response = None
-        self.corr_id = None
+        # Replies by correlation id, as (body, content_type); None until the reply arrives.
+        self._responses: Dict[str, Optional[Tuple[bytes, Optional[str]]]] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self.connection.is_open:
+            self.connection.close()
 
     def on_response(self, ch, method, props, body):
-        if self.corr_id == props.correlation_id:
-            self.response = body
-
-    def call(self, message: Message, routing_key: str, timeout: Union[int, None] = None) -> bytes:
-        self.response = None
-        self.corr_id = str(uuid.uuid4())
-        self.channel.basic_publish(
-            exchange='',
-            routing_key=routing_key,
-            properties=pika.BasicProperties(
-                reply_to=self.callback_queue,
-                correlation_id=self.corr_id
-            ),
-            body=json.dumps(message.json())
-        )
+        corr_id = props.correlation_id
+        if corr_id in self._responses and self._responses[corr_id] is None:
+            self._responses[corr_id] = (body, props.content_type)
+
+    def call(self, message: Message, routing_key: str, timeout: Union[int, None] = None) -> Any:
+        return self.call_many([message], routing_key, timeout)[0]
+
+    def call_many(self, messages: Iterable[Message], routing_key: str,
+                  timeout: Union[int, None] = None) -> List[Any]:
+        # All requests are published before waiting, so the server can work
+        # through them back to back instead of one round trip each.
+        corr_ids = []
+        try:
+            for message in messages:
+                corr_id = secrets.token_hex(8)
+                corr_ids.append(corr_id)
+                self._responses[corr_id] = None
+                self.channel.basic_publish(
+                    exchange='',
+                    routing_key=routing_key,
+                    properties=pika.BasicProperties(
+                        reply_to=self.callback_queue,
+                        correlation_id=corr_id
+                    ),
+                    body=message.dumps()
+                )
+
+            # Each process_data_events call blocks until I/O arrives or the
+            # remaining time runs out, so waiting never spins.
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while any(self._responses[corr_id] is None for corr_id in corr_ids):
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"No response from '{routing_key}' within {timeout}s")
+                self.connection.process_data_events(time_limit=remaining)
+
+            return [decode_response(*self._responses[corr_id]) for corr_id in corr_ids]
+        finally:
+            # Replies arriving after a failure or timeout no longer match and are dropped.
+            for corr_id in corr_ids:
+                self._responses.pop(corr_id, None)
+
+# pika connections are not thread-safe, so clients are shared per thread.
+_local = threading.local()
 
-        while self.response is None:
-            self.connection.process_data_events(time_limit=timeout)
 
-        return self.response
+def get_client(host: str) -> RPCClient:
+    """Returns this thread's reusable client for host, reconnecting if it was closed."""
+    clients = getattr(_local, "clients", None)
+    if clients is None:
+        clients = _local.clients = {}
+    client = clients.get(host)
+    if client is None or client.connection.is_closed:
+        client = clients[host] = RPCClient(host=host)
+    return client
@@ -0,0 +1,34 @@
+"""
+Encoding of RPC replies, shared by RPCServer and RPCClient.
+"""
+
+from typing import Any, Optional, Tuple
+
+import pydantic_core
+
+# The reply's content type tells the client how its body is encoded.
+JSON_CONTENT_TYPE = "application/json"
+BYTES_CONTENT_TYPE = "application/octet-stream"
+ERROR_CONTENT_TYPE = "application/vnd.dtlabs.rpc-error+json"
+
+
+def encode_response(response: Any) -> Tuple[bytes, str]:
+    """Encodes a handler's return value as a (body, content_type) pair; never raises."""
+    # Bytes are sent as-is, so binary results survive without any conversion.
+    if isinstance(response, (bytes, bytearray, memoryview)):
+        return bytes(response), BYTES_CONTENT_TYPE
+    try:
+        # Values JSON has no type for are sent as their str(), as before.
+        return pydantic_core.to_json(response, serialize_unknown=True), JSON_CONTENT_TYPE
+    except pydantic_core.PydanticSerializationError as e:
+        error = f"Response of type {type(response).__name__} could not be serialized: {e}"
+        return pydantic_core.to_json({"error": error}), ERROR_CONTENT_TYPE
+
+
+def decode_response(body: bytes, content_type: Optional[str]) -> Any:
+    """Decodes a reply produced by encode_response, raising RuntimeError for error replies."""
+    if content_type == BYTES_CONTENT_TYPE:
+        return body
+    if content_type == ERROR_CONTENT_TYPE:
+        raise RuntimeError(pydantic_core.from_json(body)["error"])
+    return pydantic_core.from_json(body)
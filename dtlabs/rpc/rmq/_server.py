@@ -1,13 +1,16 @@
 import pika
-import json
+import pydantic_core
 from typing import Callable
 
+from dtlabs.rpc.rmq._codec import encode_response
+
 
 class RPCServer:
-    def __init__(self, host: str, queue: str, func: Callable):
+    def __init__(self, host: str, queue: str, func: Callable, prefetch_count: int = 16):
         self.host = host
         self.__func = func
         self.queue = queue
+        self.prefetch_count = prefetch_count
 
         self.connection = pika.BlockingConnection(
             pika.ConnectionParameters(host=self.host)
@@ -16,23 +19,24 @@ class RPCServer:
         self.channel.queue_declare(queue=self.queue)
 
     def on_request(self, ch, method, props, body):
-        # NOTE: There should be a reason for line #21
-        body_dict = json.loads(json.loads(body))
+        body_dict = pydantic_core.from_json(body)
         response = self.__func(**body_dict)
+        body, content_type = encode_response(response)
 
         ch.basic_publish(
             exchange='',
             routing_key=props.reply_to,
             properties=pika.BasicProperties(
-                correlation_id=props.correlation_id
+                correlation_id=props.correlation_id,
+                content_type=content_type
             ),
-            body=str(response)
+            body=body
         )
 
         ch.basic_ack(delivery_tag=method.delivery_tag)
 
     def start_consuming(self):
-        self.channel.basic_qos(prefetch_count=1)
+        self.channel.basic_qos(prefetch_count=self.prefetch_count)
         self.channel.basic_consume(queue=self.queue, on_message_callback=self.on_request)
         self.channel.start_consuming()
     
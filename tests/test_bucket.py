@@ -1,7 +1,10 @@
 import os
+import asyncio
 import pytest
 from dotenv import load_dotenv
 from dtlabs.cloud.buckets.bucket import Bucket
+from dtlabs.cloud.buckets._base import MIN_PART_SIZE
+from dtlabs.cloud.buckets.async_bucket import AsyncBucket
 
 # Carregar variáveis de ambiente
 load_dotenv()
@@ -63,6 +66,42 @@ def test_upload_download_file(cloud_bucket):
     cloud_bucket.delete_file(test_filename)
 
 
+def test_upload_item_file_object(cloud_bucket, tmp_path):
+    """Testa o upload de um arquivo aberto com upload_item."""
+    test_filename = "test_file_object.txt"
+    test_content = b"Hello, Cloud!"
+    local_file = tmp_path / test_filename
+    local_file.write_bytes(test_content)
+
+    with open(local_file, "rb") as f:
+        cloud_bucket.upload_item(test_filename, f)
+
+    assert cloud_bucket.read_file(test_filename) == test_content
+
+    # Cleanup
+    cloud_bucket.delete_file(test_filename)
+
+
+def test_upload_stream(cloud_bucket):
+    """Testa o upload em partes a partir de um iterador de chunks."""
+    test_filename = "test_stream.bin"
+    chunk = os.urandom(1024 * 1024)
+    chunks = [chunk] * 11  # 11MB: duas partes completas e uma parcial
+
+    cloud_bucket.upload_stream(test_filename, iter(chunks), part_size=MIN_PART_SIZE)
+    assert cloud_bucket.read_file(test_filename) == b"".join(chunks)
+
+    # Um stream menor que uma parte é enviado de uma só vez
+    cloud_bucket.upload_stream(test_filename, iter([b"Hello, ", b"Cloud!"]))
+    assert cloud_bucket.read_file(test_filename) == b"Hello, Cloud!"
+
+    with pytest.raises(ValueError):
+        cloud_bucket.upload_stream(test_filename, iter([b"x"]), part_size=1024)
+
+    # Cleanup
+    cloud_bucket.delete_file(test_filename)
+
+
 def test_generate_url(cloud_bucket):
     """Testa a geração de URL para um arquivo armazenado."""
     test_filename = "test_file.txt"
@@ -106,3 +145,25 @@ def test_download_file(cloud_bucket):
     # Cleanup
     os.remove(test_filename)
     cloud_bucket.delete_file(test_filename)
+
+
+def test_async_bulk_upload(cloud_bucket, tmp_path):
+    """Testa o upload concorrente de arquivos com AsyncBucket."""
+    test_folder = "test_async_folder/"
+    test_files = ["file1.txt", "file2.txt", "file3.txt"]
+    paths = []
+    for file in test_files:
+        local_file = tmp_path / file
+        local_file.write_bytes(b"Dummy content")
+        paths.append((str(local_file), f"{test_folder}{file}"))
+
+    async def run():
+        async with AsyncBucket(cloud_bucket) as async_bucket:
+            await async_bucket.bulk_upload(paths, concurrency=2)
+            return await async_bucket.list_folder(test_folder)
+
+    files_in_bucket = asyncio.run(run())
+    assert set(files_in_bucket) == {target for _, target in paths}
+
+    # Cleanup
+    cloud_bucket.delete_folder(test_folder)
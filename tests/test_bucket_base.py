@@ -0,0 +1,55 @@
+import io
+from dtlabs.cloud.buckets._base import _item_size, _iter_parts
+
+
+def test_item_size_bytes():
+    """Testa o tamanho de itens em bytes e bytearray."""
+    assert _item_size(b"abc") == 3
+    assert _item_size(bytearray(b"abcd")) == 4
+
+
+def test_item_size_stream(tmp_path):
+    """Testa o tamanho de streams a partir da posição atual, sem movê-la."""
+    stream = io.BytesIO(b"0123456789")
+    stream.seek(4)
+    assert _item_size(stream) == 6
+    assert stream.tell() == 4
+
+    path = tmp_path / "item.bin"
+    path.write_bytes(b"x" * 100)
+    with open(path, "rb") as f:
+        assert _item_size(f) == 100
+        assert f.tell() == 0
+
+
+def test_item_size_unseekable():
+    """Testa que streams sem seek têm tamanho desconhecido."""
+    class Unseekable(io.RawIOBase):
+        def readable(self):
+            return True
+
+    assert _item_size(Unseekable()) is None
+
+
+def test_iter_parts_exact_multiple():
+    """Testa que um stream múltiplo do tamanho da parte não gera parte vazia no final."""
+    parts = list(_iter_parts([b"ab", b"cd", b"ef"], 2))
+    assert parts == [(b"ab", False), (b"cd", False), (b"ef", True)]
+
+
+def test_iter_parts_empty_stream():
+    """Testa que um stream vazio gera uma única parte vazia."""
+    assert list(_iter_parts([], 4)) == [(b"", True)]
+    assert list(_iter_parts([b"", b""], 4)) == [(b"", True)]
+
+
+def test_iter_parts_large_chunks():
+    """Testa que chunks maiores que a parte são divididos em partes exatas."""
+    parts = list(_iter_parts([b"abcdefg", b"hi"], 3))
+    assert parts == [(b"abc", False), (b"def", False), (b"ghi", True)]
+
+
+def test_iter_parts_small_chunks():
+    """Testa que chunks menores que a parte são agrupados."""
+    parts = list(_iter_parts([b"a", b"b", b"c", b"d", b"e"], 2))
+    assert parts == [(b"ab", False), (b"cd", False), (b"e", True)]
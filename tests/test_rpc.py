@@ -42,7 +42,75 @@ def test_rpc_client(rpc_server):
 
     message = AddArgument(x=3, y=5)
 
-    client = dtlabs.rpc.RPCClient(host=host)
-    response = client.call(
-        message, routing_key=routing_key, timeout=5)  # Add timeout
+    with dtlabs.rpc.RPCClient(host=host) as client:
+        response = client.call(
+            message, routing_key=routing_key, timeout=5)  # Add timeout
     assert int(response) == 8  # Check if the sum is correct
+
+
+def test_rpc_client_reuse(rpc_server):
+    host = "localhost"
+    routing_key = "test_rpc_queue"
+
+    client = dtlabs.rpc.get_client(host)
+    assert dtlabs.rpc.get_client(host) is client  # Same connection is reused
+
+    for x, y in [(1, 2), (10, 20)]:
+        response = client.call(
+            AddArgument(x=x, y=y), routing_key=routing_key, timeout=5)
+        assert response == x + y
+
+
+def test_rpc_client_call_many(rpc_server):
+    host = "localhost"
+    routing_key = "test_rpc_queue"
+
+    messages = [AddArgument(x=x, y=x) for x in range(10)]
+
+    with dtlabs.rpc.RPCClient(host=host) as client:
+        responses = client.call_many(
+            messages, routing_key=routing_key, timeout=5)
+    assert responses == [2 * x for x in range(10)]
+
+
+def test_rpc_client_after_timeout(rpc_server):
+    host = "localhost"
+    routing_key = "test_rpc_queue"
+
+    with dtlabs.rpc.RPCClient(host=host) as client:
+        # Nobody consumes this queue, so the call times out
+        with pytest.raises(TimeoutError):
+            client.call(AddArgument(x=1, y=2), routing_key="test_rpc_no_consumer", timeout=0.2)
+
+        # The timed-out call must not block later calls on the same client
+        response = client.call(AddArgument(x=3, y=4), routing_key=routing_key, timeout=5)
+        assert response == 7
+
+
+@pytest.fixture(scope="module")
+def bytes_rpc_server():
+    host = "localhost"
+    queue = "test_rpc_bytes_queue"
+
+    def header_fn(x: int, y: int) -> bytes:
+        return b"\x89PNG" + bytes([x, y])  # Not valid UTF-8
+
+    server = dtlabs.rpc.RPCServer(host=host, queue=queue, func=header_fn)
+
+    thread = threading.Thread(target=server.start_consuming, daemon=True)
+    thread.start()
+    time.sleep(1)
+
+    yield server
+
+    del server
+    thread.join(timeout=2)
+
+
+def test_rpc_client_bytes_response(bytes_rpc_server):
+    host = "localhost"
+    routing_key = "test_rpc_bytes_queue"
+
+    with dtlabs.rpc.RPCClient(host=host) as client:
+        response = client.call(AddArgument(x=1, y=2), routing_key=routing_key, timeout=5)
+    assert response == b"\x89PNG\x01\x02"
@@ -0,0 +1,27 @@
+import pytest
+from dtlabs.rpc.rmq._codec import decode_response, encode_response
+
+
+@pytest.mark.parametrize("response", [3, "text", [1, 2.5], {"a": [True, None]}])
+def test_json_round_trip(response):
+    assert decode_response(*encode_response(response)) == response
+
+
+def test_bytes_round_trip():
+    # Not valid UTF-8, so it can't be sent as a JSON string
+    response = b"\x89PNG\r\n\x1a\n"
+    assert decode_response(*encode_response(response)) == response
+
+
+def test_unknown_object_sent_as_str():
+    class Point:
+        def __str__(self):
+            return "Point(1, 2)"
+
+    assert decode_response(*encode_response(Point())) == "Point(1, 2)"
+
+
+def test_unserializable_response_raises_on_client():
+    body, content_type = encode_response({"image": b"\x89PNG"})
+    with pytest.raises(RuntimeError, match="could not be serialized"):
+        decode_response(body, content_type)
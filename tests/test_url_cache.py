@@ -0,0 +1,47 @@
+from unittest import mock
+from dtlabs.cloud.buckets._url_cache import URLCache
+
+
+def test_url_cache_hit():
+    """Testa que uma URL armazenada é reutilizada."""
+    cache = URLCache()
+    with mock.patch("time.monotonic", return_value=1000.0):
+        assert cache.get("file.txt", 3600) is None
+        cache.put("file.txt", 3600, "https://url")
+        assert cache.get("file.txt", 3600) == "https://url"
+
+
+def test_url_cache_expires_after_half_lifetime():
+    """Testa que a URL deixa de ser reutilizada após metade da validade."""
+    cache = URLCache()
+    with mock.patch("time.monotonic", return_value=1000.0):
+        cache.put("file.txt", 3600, "https://url")
+    with mock.patch("time.monotonic", return_value=1000.0 + 1799):
+        assert cache.get("file.txt", 3600) == "https://url"
+    with mock.patch("time.monotonic", return_value=1000.0 + 1800):
+        assert cache.get("file.txt", 3600) is None
+
+
+def test_url_cache_keyed_by_expiration():
+    """Testa que expirações diferentes são armazenadas separadamente."""
+    cache = URLCache()
+    with mock.patch("time.monotonic", return_value=1000.0):
+        cache.put("file.txt", 3600, "https://url-1h")
+        assert cache.get("file.txt", 60) is None
+        cache.put("file.txt", 60, "https://url-1m")
+        assert cache.get("file.txt", 3600) == "https://url-1h"
+        assert cache.get("file.txt", 60) == "https://url-1m"
+
+
+def test_url_cache_evicts_least_recently_used():
+    """Testa que a URL menos usada recentemente é descartada ao atingir maxsize."""
+    cache = URLCache(maxsize=2)
+    with mock.patch("time.monotonic", return_value=1000.0):
+        cache.put("a.txt", 3600, "https://a")
+        cache.put("b.txt", 3600, "https://b")
+        assert cache.get("a.txt", 3600) == "https://a"  # "b.txt" passa a ser a menos usada
+        cache.put("c.txt", 3600, "https://c")
+
+        assert cache.get("b.txt", 3600) is None
+        assert cache.get("a.txt", 3600) == "https://a"
+        assert cache.get("c.txt", 3600) == "https://c"